@@ -325,6 +325,7 @@ async def main() -> None:
             # Correlate Rootly users with GitHub accounts
             correlator: GitHubCorrelator = GitHubCorrelator(github_token, config)
             github_correlations: Dict[str, Optional[str]] = correlator.correlate_users(raw_data['users'])
+            correlator.close()
             
             # Add correlation results to raw_data for analysis
             raw_data['github_correlations'] = github_correlations
@@ -348,6 +349,7 @@ async def main() -> None:
                     github_correlations, 
                     config['analysis']['days_to_analyze']
                 )
+                github_collector.close()
                 
                 # Add GitHub activity to raw_data
                 raw_data['github_activity'] = github_activity
@@ -458,8 +460,16 @@ async def main() -> None:
         if config.get("output", {}).get("create_dashboard", True):
             print("Generating dashboard...")
             dashboard: BurnoutDashboard = BurnoutDashboard(results)
-            dashboard_path: str = os.path.join(args.output, "dashboard.html")
-            dashboard.generate_dashboard(dashboard_path)
+            compress_dashboard: bool = config.get("output", {}).get("compress_dashboard", False)
+            inline_chart_data: bool = config.get("output", {}).get("inline_chart_data", True)
+            inline_css: bool = config.get("output", {}).get("inline_css", True)
+            dashboard_path: str = os.path.join(args.output, "dashboard.html.gz" if compress_dashboard else "dashboard.html")
+            dashboard.generate_dashboard(
+                dashboard_path,
+                compress=compress_dashboard,
+                inline_data=inline_chart_data,
+                inline_css=inline_css
+            )
             print(f"Dashboard saved to {dashboard_path}")
         
         # Print summary
@@ -2,7 +2,8 @@
 Custom smolagents tools for burnout analysis data access.
 """
 
-from typing import Any, Dict
+import heapq
+from typing import Any, Dict, Optional
 from smolagents import Tool
 
 
@@ -70,64 +71,44 @@ class BurnoutDataTool(Tool):
     
     def _get_high_risk_users(self) -> str:
         """Get details of high-risk users."""
-        individual = self.results.get("individual_analyses", [])
-        high_risk = [a for a in individual if a.get("risk_level") == "high"]
-        
-        if not high_risk:
-            return "No high-risk users found."
-        
-        result = "High Risk Users:\n"
-        for user in high_risk:
-            key_metrics = user.get('key_metrics', {})
-            result += f"\n- {user.get('user_name', 'Unknown')} (Score: {user.get('burnout_score', 0)}/10)\n"
-            result += f"  Incidents: {key_metrics.get('total_incidents', 0)}\n"
-            result += f"  After-hours %: {key_metrics.get('after_hours_incidents', 0) / max(key_metrics.get('total_incidents', 1), 1) * 100:.1f}%\n"
-            
-            recommendations = user.get("recommendations", [])[:2]
-            if recommendations:
-                result += f"  Top recommendations: {', '.join(recommendations)}\n"
-        
-        return result
+        return self._render_risk_bucket("high")
     
     def _get_medium_risk_users(self) -> str:
         """Get details of medium-risk users."""
-        individual = self.results.get("individual_analyses", [])
-        medium_risk = [a for a in individual if a.get("risk_level") == "medium"]
-        
-        if not medium_risk:
-            return "No medium-risk users found."
-        
-        result = "Medium Risk Users:\n"
-        for user in medium_risk:
-            key_metrics = user.get('key_metrics', {})
-            result += f"\n- {user.get('user_name', 'Unknown')} (Score: {user.get('burnout_score', 0)}/10)\n"
-            result += f"  Incidents: {key_metrics.get('total_incidents', 0)}\n"
-            result += f"  After-hours %: {key_metrics.get('after_hours_incidents', 0) / max(key_metrics.get('total_incidents', 1), 1) * 100:.1f}%\n"
-            
-            recommendations = user.get("recommendations", [])[:2]
-            if recommendations:
-                result += f"  Top recommendations: {', '.join(recommendations)}\n"
-        
-        return result
+        return self._render_risk_bucket("medium")
     
     def _get_low_risk_users(self) -> str:
         """Get details of low-risk users."""
+        # Only show first 10 to avoid overwhelming output
+        return self._render_risk_bucket("low", limit=10, include_recommendations=False)
+    
+    def _render_risk_bucket(self, level: str, limit: Optional[int] = None,
+                            include_recommendations: bool = True) -> str:
+        """Render the users at a given risk level, optionally capped at `limit`."""
         individual = self.results.get("individual_analyses", [])
-        low_risk = [a for a in individual if a.get("risk_level") == "low"]
+        users = [a for a in individual if a.get("risk_level") == level]
         
-        if not low_risk:
-            return "No low-risk users found."
+        if not users:
+            return f"No {level}-risk users found."
         
-        # Only show first 10 to avoid overwhelming output
-        result = f"Low Risk Users (showing first 10 of {len(low_risk)}):\n"
-        for user in low_risk[:10]:
+        if limit is None:
+            result = f"{level.capitalize()} Risk Users:\n"
+        else:
+            result = f"{level.capitalize()} Risk Users (showing first {limit} of {len(users)}):\n"
+        
+        for user in users[:limit]:
             key_metrics = user.get('key_metrics', {})
             result += f"\n- {user.get('user_name', 'Unknown')} (Score: {user.get('burnout_score', 0)}/10)\n"
             result += f"  Incidents: {key_metrics.get('total_incidents', 0)}\n"
             result += f"  After-hours %: {key_metrics.get('after_hours_incidents', 0) / max(key_metrics.get('total_incidents', 1), 1) * 100:.1f}%\n"
+            
+            if include_recommendations:
+                recommendations = user.get("recommendations", [])[:2]
+                if recommendations:
+                    result += f"  Top recommendations: {', '.join(recommendations)}\n"
         
-        if len(low_risk) > 10:
-            result += f"\n... and {len(low_risk) - 10} more low-risk users."
+        if limit is not None and len(users) > limit:
+            result += f"\n... and {len(users) - limit} more {level}-risk users."
         
         return result
     
@@ -345,13 +326,18 @@ class RecommendationTool(Tool):
     def _user_recommendations(self, query: str) -> str:
         """Get recommendations for specific users."""
         individual = self.results.get("individual_analyses", [])
-        high_risk = [a for a in individual if a.get("risk_level") == "high"]
-        
-        if not high_risk:
+        # Top 3 high-risk users by score, without materializing the full high-risk list
+        top_high_risk = heapq.nlargest(
+            3,
+            (a for a in individual if a.get("risk_level") == "high"),
+            key=lambda a: a.get("burnout_score", 0)
+        )
+        
+        if not top_high_risk:
             return "No high-risk users requiring immediate recommendations."
         
         result = "User-Specific Recommendations:\n"
-        for user in high_risk[:3]:  # Top 3 high-risk users
+        for user in top_high_risk:
             result += f"\n{user.get('user_name', 'Unknown')} (Score: {user.get('burnout_score')}/10):\n"
             recommendations = user.get("recommendations", [])
             for i, rec in enumerate(recommendations[:3], 1):
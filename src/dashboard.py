@@ -2,136 +2,125 @@
 Dashboard generator for burnout analysis results.
 """
 
+import gzip
+import html
 import json
-from typing import Dict, Any, List
-from pathlib import Path
+import os
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, List, BinaryIO, NamedTuple, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class BurnoutDashboard:
-    """Generates HTML dashboard from burnout analysis results."""
-    
-    def __init__(self, results: Dict[str, Any]):
-        self.results = results
-        self.template_dir = Path(__file__).parent / "templates"
-    
-    def generate_dashboard(self, output_path: str):
-        """Generate complete HTML dashboard."""
-        html_content = self._generate_html()
-        
-        with open(output_path, 'w') as f:
-            f.write(html_content)
-    
-    def _generate_html(self) -> str:
-        """Generate the complete HTML content."""
-        individual_analyses = self.results.get("individual_analyses", [])
-        metadata = self.results.get("metadata", {})
-        
-        # Format timestamp for display
-        timestamp = metadata.get('analysis_timestamp', 'N/A')
-        if timestamp != 'N/A':
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                formatted_timestamp = dt.strftime('%B %d, %Y at %I:%M %p')
-            except:
-                formatted_timestamp = timestamp
-        else:
-            formatted_timestamp = timestamp
-        
-        # Prepare data for JavaScript
-        chart_data = self._prepare_chart_data(individual_analyses)
-        
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Rootly Burnout Analysis Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        body {{
+try:
+    from markupsafe import escape as markupsafe_escape
+except ImportError:
+    markupsafe_escape = None
+
+# Risk level -> (CSS class, score badge color, chart bar shades for the
+# incident/GitHub/Slack stacks from darkest to lightest); unknown levels
+# render as low
+_RISK_STYLES = {
+    'high': ('risk-high', '#dc3545', ('#dc3545', '#e65665', '#f07885')),
+    'medium': ('risk-medium', '#ffc107', ('#ffc107', '#ffcd38', '#ffd969')),
+    'low': ('risk-low', '#28a745', ('#28a745', '#48b461', '#68c17d')),
+}
+
+# Shared default for optional sub-dicts that are only ever read, so a
+# missing section does not allocate a fresh empty dict per lookup
+_EMPTY: Dict[str, Any] = {}
+
+# Static page segments, encoded once at import so rendering only has to
+# format and encode the handful of per-dashboard values.
+_CSS = """
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
-        .header {{
+        }
+        .header {
             background: white;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 20px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .metrics-grid {{
+        }
+        .metrics-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 20px;
-        }}
-        .metric-card {{
+        }
+        .metric-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .metric-value {{
+        }
+        .metric-value {
             font-size: 2em;
             font-weight: bold;
             margin-bottom: 5px;
-        }}
-        .metric-label {{
+        }
+        .metric-label {
             color: #666;
             font-size: 0.9em;
-        }}
-        .risk-high {{ color: #dc3545; }}
-        .risk-medium {{ color: #ffc107; }}
-        .risk-low {{ color: #28a745; }}
-        .chart-container {{
+        }
+        .risk-high { color: #dc3545; }
+        .risk-medium { color: #ffc107; }
+        .risk-low { color: #28a745; }
+        .chart-container {
             background: white;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 20px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             height: 350px;
-        }}
-        .user-list {{
+        }
+        .user-list {
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .user-item {{
+        }
+        .user-item {
             padding: 15px 20px;
             border-bottom: 1px solid #eee;
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
-        .user-item:last-child {{
+        }
+        .user-item:last-child {
             border-bottom: none;
-        }}
-        .user-name {{
+        }
+        .user-name {
             font-weight: 500;
-        }}
-        .expand-arrow {{
+        }
+        .expand-arrow {
             cursor: pointer;
             margin-right: 8px;
             color: #007bff;
             font-size: 12px;
             transition: transform 0.2s ease;
             display: inline-block;
-        }}
-        .expand-arrow:hover {{
+        }
+        .expand-arrow:hover {
             color: #0056b3;
-        }}
-        .expand-arrow.expanded {{
+        }
+        .expand-arrow.expanded {
             transform: rotate(90deg);
-        }}
-        .user-details {{
+        }
+        .user-details {
             display: none;
             margin-top: 15px;
             padding: 20px;
@@ -141,21 +130,21 @@ class BurnoutDashboard:
             border-radius: 12px;
             border: 1px solid #e9ecef;
             box-shadow: 0 4px 12px rgba(0,0,0,0.05);
-        }}
-        .user-details.show {{
+        }
+        .user-details.show {
             display: block;
-        }}
-        .detail-section {{
+        }
+        .detail-section {
             margin-bottom: 20px;
             padding: 16px;
             background-color: rgba(255,255,255,0.7);
             border-radius: 8px;
             border-left: 4px solid #007bff;
-        }}
-        .detail-section:last-child {{
+        }
+        .detail-section:last-child {
             margin-bottom: 0;
-        }}
-        .detail-label {{
+        }
+        .detail-label {
             font-weight: 600;
             color: #2c3e50;
             margin-bottom: 8px;
@@ -163,14 +152,14 @@ class BurnoutDashboard:
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
-        .detail-value {{
+        }
+        .detail-value {
             font-size: 0.9em;
             color: #495057;
             margin-left: 0;
             line-height: 1.5;
-        }}
-        .metric-row {{
+        }
+        .metric-row {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -178,56 +167,95 @@ class BurnoutDashboard:
             padding: 8px 12px;
             background-color: rgba(248,249,250,0.8);
             border-radius: 6px;
-        }}
-        .metric-row:last-child {{
+        }
+        .metric-row:last-child {
             margin-bottom: 0;
-        }}
-        .metric-row span:first-child {{
+        }
+        .metric-row span:first-child {
             color: #6c757d;
             font-weight: 500;
-        }}
-        .metric-row span:last-child {{
+        }
+        .metric-row span:last-child {
             color: #2c3e50;
             font-weight: 600;
-        }}
-        .user-score {{
+        }
+        .user-score {
             font-weight: bold;
             padding: 4px 8px;
             border-radius: 4px;
             color: white;
-        }}
-        .recommendations {{
+        }
+        .recommendations {
             background: white;
             padding: 20px;
             border-radius: 8px;
             margin-top: 20px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .rec-item {{
+        }
+        .rec-item {
             padding: 10px 0;
             border-bottom: 1px solid #eee;
-        }}
-        .rec-item:last-child {{
+        }
+        .rec-item:last-child {
             border-bottom: none;
-        }}
-        h1, h2, h3 {{
+        }
+        h1, h2, h3 {
             margin-top: 0;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             color: #666;
             font-size: 0.9em;
-        }}
-    </style>
-</head>
+        }
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+_INDENT_RE = re.compile(r'^\s+', re.M)
+
+
+def _strip_indent(text: str) -> str:
+    """Drop leading indentation and blank lines; line breaks are kept so inline JS comments still end."""
+    return _INDENT_RE.sub('', text)
+
+
+_MINIFIED_CSS = _minify_css(_CSS).encode()
+
+_HTML_HEAD_OPEN = _strip_indent("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Rootly Burnout Analysis Dashboard</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+""").encode()
+
+_HTML_HEAD_CLOSE = _strip_indent("""</head>
 <body>
-    <div class="container">
+""").encode()
+
+_HTML_HEAD = _HTML_HEAD_OPEN + b"<style>" + _MINIFIED_CSS + b"</style>\n" + _HTML_HEAD_CLOSE
+
+_STYLESHEET_LINK_TEMPLATE = _strip_indent("""    <link rel="stylesheet" href="{href}">
+""")
+
+_HEADER_TEMPLATE = _strip_indent("""    <div class="container">
         <div class="header">
             <h1>Rootly Burnout Analysis Dashboard</h1>
             <p class="timestamp">Analysis completed: {formatted_timestamp}</p>
-            <p>Period: {metadata.get('days_analyzed', 'N/A')} days | 
-               Users: {metadata.get('total_users_analyzed', 'N/A')} | 
-               Incidents: {metadata.get('total_incidents', 'N/A')}{self._get_github_integration_status(metadata)}{self._get_slack_integration_status(metadata)}</p>
-            
+            <p>Period: {days_analyzed} days | 
+               Users: {total_users} | 
+               Incidents: {total_incidents}{integrations}</p>
+""")
+
+_SCORING_NOTE = _strip_indent("""            
             <div style="margin-top: 15px; padding: 15px; background-color: #f8f9fa; border-radius: 5px; border-left: 4px solid #007bff;">
                 <h4 style="margin: 0 0 10px 0; color: #495057;">How Burnout Scores Are Calculated</h4>
                 <p style="margin: 0; color: #6c757d; font-size: 0.9em;">
@@ -240,312 +268,50 @@ class BurnoutDashboard:
             </div>
         </div>
         
-        <div class="metrics-grid">
+""").encode()
+
+_METRICS_TEMPLATE = _strip_indent("""        <div class="metrics-grid">
             <div class="metric-card">
-                <div class="metric-value risk-high">{self._count_risk_level(individual_analyses, 'high')}</div>
+                <div class="metric-value risk-high">{high_count}</div>
                 <div class="metric-label">High Risk Users</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value risk-medium">{self._count_risk_level(individual_analyses, 'medium')}</div>
+                <div class="metric-value risk-medium">{medium_count}</div>
                 <div class="metric-label">Medium Risk Users</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value risk-low">{self._count_risk_level(individual_analyses, 'low')}</div>
+                <div class="metric-value risk-low">{low_count}</div>
                 <div class="metric-label">Low Risk Users</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{self._calculate_average_score(individual_analyses)}/10</div>
+                <div class="metric-value">{average_score}/10</div>
                 <div class="metric-label">Average Score</div>
             </div>
         </div>
         
-        <div class="chart-container">
+""")
+
+_NO_ANALYSES_BODY = _strip_indent("""        <div class="chart-container">
+            <h3>No analyses available</h3>
+            <p>No individual analyses were produced for this period.</p>
+        </div>
+    </div>
+</body>
+</html>
+""").encode()
+
+_USER_LIST_OPEN = _strip_indent("""        <div class="chart-container">
             <h3>Burnout Scores by User</h3>
             <canvas id="scoresChart" width="400" height="150"></canvas>
         </div>
         
         <div class="user-list">
             <h3 style="padding: 20px 20px 0 20px;">Individual Analysis</h3>
-            {self._generate_user_list(individual_analyses)}
-        </div>
-    </div>
-    
-    <script>
-        // Burnout scores bar chart
-        const scoresCtx = document.getElementById('scoresChart').getContext('2d');
-        new Chart(scoresCtx, {{
-            type: 'bar',
-            data: {{
-                labels: {json.dumps(chart_data['user_names'])},
-                datasets: [
-                    {{
-                        label: 'Incident Data',
-                        data: {json.dumps(chart_data['incident_scores'])},
-                        backgroundColor: {json.dumps(chart_data['incident_colors'])},
-                        borderColor: {json.dumps(chart_data['incident_colors'])},
-                        borderWidth: 0
-                    }},
-                    {{
-                        label: 'GitHub Data',
-                        data: {json.dumps(chart_data['github_scores'])},
-                        backgroundColor: {json.dumps(chart_data['github_colors'])},
-                        borderColor: {json.dumps(chart_data['github_colors'])},
-                        borderWidth: 0
-                    }},
-                    {{
-                        label: 'Slack Data',
-                        data: {json.dumps(chart_data['slack_scores'])},
-                        backgroundColor: {json.dumps(chart_data['slack_colors'])},
-                        borderColor: {json.dumps(chart_data['slack_colors'])},
-                        borderWidth: 0
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                scales: {{
-                    x: {{
-                        stacked: true
-                    }},
-                    y: {{
-                        stacked: true,
-                        beginAtZero: true,
-                        max: 10,
-                        ticks: {{
-                            stepSize: 2
-                        }}
-                    }}
-                }},
-                plugins: {{
-                    legend: {{
-                        display: true,
-                        position: 'bottom',
-                        labels: {{
-                            boxWidth: 12,
-                            padding: 10,
-                            font: {{
-                                size: 11
-                            }}
-                        }}
-                    }},
-                    tooltip: {{
-                        mode: 'index',
-                        intersect: false,
-                        callbacks: {{
-                            afterTitle: function(context) {{
-                                const dataIndex = context[0].dataIndex;
-                                const total = context[0].chart.data.datasets.reduce((sum, dataset) => {{
-                                    return sum + (dataset.data[dataIndex] || 0);
-                                }}, 0);
-                                return 'Total Score: ' + total.toFixed(2);
-                            }},
-                            label: function(context) {{
-                                const value = context.parsed.y;
-                                const dataIndex = context.dataIndex;
-                                const total = context.chart.data.datasets.reduce((sum, dataset) => {{
-                                    return sum + (dataset.data[dataIndex] || 0);
-                                }}, 0);
-                                const percentage = ((value / total) * 100).toFixed(0);
-                                return context.dataset.label + ': ' + value.toFixed(2) + ' (' + percentage + '% of total)';
-                            }}
-                        }}
-                    }}
-                }},
-                layout: {{
-                    padding: {{
-                        top: 10,
-                        bottom: 10
-                    }}
-                }}
-            }}
-        }});
-        
-        // Toggle user details dropdown
-        function toggleUserDetails(userId) {{
-            const detailsElement = document.getElementById('details-' + userId);
-            const arrowElement = event.target;
-            if (detailsElement) {{
-                detailsElement.classList.toggle('show');
-                arrowElement.classList.toggle('expanded');
-            }}
-        }}
-    </script>
-</body>
-</html>
-        """
-        
-        return html
-    
-    def _prepare_chart_data(self, individual_analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Prepare data for JavaScript charts with stacked data source contributions."""
-        user_names = []
-        incident_scores = []
-        github_scores = []
-        slack_scores = []
-        incident_colors = []
-        github_colors = []
-        slack_colors = []
-        
-        # User scores data (sorted by score, descending)
-        sorted_analyses = sorted(
-            individual_analyses, 
-            key=lambda x: x.get('burnout_score', 0), 
-            reverse=True
-        )
-        
-        for analysis in sorted_analyses:
-            user_names.append(analysis.get('user_name', 'Unknown'))
-            
-            # Calculate data source contributions
-            # Get the burnout score components from the analysis
-            burnout_score = analysis.get('burnout_score', 0)
-            data_source_contributions = analysis.get('data_source_contributions', {})
-            
-            # If we have detailed contributions, use them
-            if data_source_contributions:
-                incident_scores.append(round(data_source_contributions.get('incident', burnout_score * 0.7), 2))
-                github_scores.append(round(data_source_contributions.get('github', 0), 2))
-                slack_scores.append(round(data_source_contributions.get('slack', 0), 2))
-            else:
-                # Estimate based on whether integrations were used
-                has_github = self._has_github_data(analysis)
-                has_slack = self._has_slack_data(analysis)
-                
-                if has_github and has_slack:
-                    # All three sources
-                    incident_scores.append(round(burnout_score * 0.7, 2))
-                    github_scores.append(round(burnout_score * 0.15, 2))
-                    slack_scores.append(round(burnout_score * 0.15, 2))
-                elif has_github:
-                    # Incident + GitHub
-                    incident_scores.append(round(burnout_score * 0.85, 2))
-                    github_scores.append(round(burnout_score * 0.15, 2))
-                    slack_scores.append(0)
-                elif has_slack:
-                    # Incident + Slack
-                    incident_scores.append(round(burnout_score * 0.85, 2))
-                    github_scores.append(0)
-                    slack_scores.append(round(burnout_score * 0.15, 2))
-                else:
-                    # Incident only
-                    incident_scores.append(round(burnout_score, 2))
-                    github_scores.append(0)
-                    slack_scores.append(0)
-            
-            # Determine colors based on risk level with different shades
-            risk_level = analysis.get('risk_level', 'low')
-            if risk_level == 'high':
-                # Red shades
-                incident_colors.append('#dc3545')  # Darkest red
-                github_colors.append('#e65665')    # Medium red
-                slack_colors.append('#f07885')     # Light red
-            elif risk_level == 'medium':
-                # Yellow shades
-                incident_colors.append('#ffc107')  # Darkest yellow
-                github_colors.append('#ffcd38')    # Medium yellow
-                slack_colors.append('#ffd969')     # Light yellow
-            else:
-                # Green shades
-                incident_colors.append('#28a745')  # Darkest green
-                github_colors.append('#48b461')    # Medium green
-                slack_colors.append('#68c17d')     # Light green
-        
-        return {
-            'user_names': user_names,
-            'incident_scores': incident_scores,
-            'github_scores': github_scores,
-            'slack_scores': slack_scores,
-            'incident_colors': incident_colors,
-            'github_colors': github_colors,
-            'slack_colors': slack_colors
-        }
-    
-    def _generate_user_list(self, individual_analyses: List[Dict[str, Any]]) -> str:
-        """Generate HTML for user list."""
-        html = ""
-        
-        # Sort by burnout score (highest first)
-        sorted_analyses = sorted(
-            individual_analyses,
-            key=lambda x: x.get('burnout_score', 0),
-            reverse=True
-        )
-        
-        for analysis in sorted_analyses:
-            user_name = analysis.get('user_name', 'Unknown')
-            score = analysis.get('burnout_score', 0)
-            risk_level = analysis.get('risk_level', 'low')
-            
-            # Determine background color for score
-            if risk_level == 'high':
-                score_class = 'risk-high'
-                bg_color = '#dc3545'
-            elif risk_level == 'medium':
-                score_class = 'risk-medium'  
-                bg_color = '#ffc107'
-            else:
-                score_class = 'risk-low'
-                bg_color = '#28a745'
-            
-            # Get top recommendation
-            recommendations = analysis.get('recommendations', [])
-            top_rec = recommendations[0] if recommendations else "No specific recommendations"
-            
-            # Generate detailed metrics display
-            user_details = self._generate_user_details(analysis)
-            
-            html += f"""
-            <div class="user-item">
-                <div style="flex: 1;">
-                    <div style="display: flex; align-items: center;">
-                        <span class="expand-arrow" onclick="toggleUserDetails('{analysis.get('user_id', '')}')">▶</span>
-                        <div class="user-name">{user_name}</div>
-                    </div>
-                    <div style="font-size: 0.8em; color: #666; margin-top: 4px;">{top_rec}</div>
-                    <div id="details-{analysis.get('user_id', '')}" class="user-details">
-                        {user_details}
-                    </div>
-                </div>
-                <div class="user-score" style="background-color: {bg_color}">{score}</div>
-            </div>
-            """
-        
-        return html
-    
-    def _generate_user_details(self, analysis: Dict[str, Any]) -> str:
-        """Generate detailed metrics for a user."""
-        user_id = analysis.get('user_id', '')
-        user_email = analysis.get('user_email', '')
-        key_metrics = analysis.get('key_metrics', {})
-        dimensions = analysis.get('dimensions', {})
-        
-        # Format key metrics
-        total_incidents = key_metrics.get('total_incidents', 0)
-        incidents_per_week = key_metrics.get('incidents_per_week', 0)
-        after_hours_incidents = key_metrics.get('after_hours_incidents', 0)
-        avg_resolution_time = key_metrics.get('avg_resolution_time_hours', 0)
-        resolution_success_rate = key_metrics.get('resolution_success_rate', 0)
-        
-        # Format resolution time as hours and minutes
-        if avg_resolution_time >= 1:
-            hours = int(avg_resolution_time)
-            minutes = int((avg_resolution_time - hours) * 60)
-            if minutes > 0:
-                resolution_time_display = f"{hours}h {minutes}m"
-            else:
-                resolution_time_display = f"{hours}h"
-        else:
-            minutes = int(avg_resolution_time * 60)
-            resolution_time_display = f"{minutes}m"
-        
-        # Format dimension scores
-        emotional_exhaustion = dimensions.get('emotional_exhaustion', {}).get('score', 0)
-        depersonalization = dimensions.get('depersonalization', {}).get('score', 0)
-        personal_accomplishment = dimensions.get('personal_accomplishment', {}).get('score', 0)
-        
-        
-        details_html = f"""
+""").encode()
+
+# Per-user details panel; format specs live in the template so each user is
+# a single format_map call instead of re-evaluating a large f-string.
+_USER_DETAILS_TEMPLATE = _strip_indent("""
         <div class="detail-section">
             <div class="detail-label">📧 Contact</div>
             <div class="detail-value">User ID: {user_id}</div>
@@ -592,22 +358,549 @@ class BurnoutDashboard:
             </div>
         </div>
         
-        {self._generate_github_metrics_section(dimensions)}
-        {self._generate_slack_metrics_section(dimensions)}
+        {github_section}
+        {slack_section}
+        """)
+
+_METRIC_ROW_TEMPLATE = _strip_indent("""
+            <div class="metric-row">
+                <span>{label}:</span>
+                <span><strong>{value}</strong></span>
+            </div>""")
+
+_COLORED_METRIC_ROW_TEMPLATE = _strip_indent("""
+            <div class="metric-row">
+                <span>{label}:</span>
+                <span><strong style="color: {color};">{value}</strong></span>
+            </div>""")
+
+
+# Band boundaries (a value above a boundary moves up a band) and the
+# (color, label) for each band, lowest first
+_SENTIMENT_THRESHOLDS = (-0.1, 0.1)
+_SENTIMENT_BANDS = (('#dc3545', 'Negative'), ('#ffc107', 'Neutral'), ('#28a745', 'Positive'))
+_VOLATILITY_THRESHOLDS = (0.2, 0.4)
+_VOLATILITY_BANDS = (('#28a745', 'Low'), ('#ffc107', 'Moderate'), ('#dc3545', 'High'))
+
+
+def _sentiment_color(sentiment: float) -> str:
+    """Color an average Slack sentiment score green/yellow/red."""
+    return _SENTIMENT_BANDS[bisect_left(_SENTIMENT_THRESHOLDS, sentiment)][0]
+
+
+def _format_sentiment(sentiment: float) -> str:
+    """Format an average Slack sentiment score with its label."""
+    return f"{sentiment:.2f} ({_SENTIMENT_BANDS[bisect_left(_SENTIMENT_THRESHOLDS, sentiment)][1]})"
+
+
+def _volatility_color(volatility: float) -> str:
+    """Color a Slack sentiment volatility score red/yellow/green."""
+    return _VOLATILITY_BANDS[bisect_left(_VOLATILITY_THRESHOLDS, volatility)][0]
+
+
+def _format_volatility(volatility: float) -> str:
+    """Format a Slack sentiment volatility score with its label."""
+    return f"{volatility:.2f} ({_VOLATILITY_BANDS[bisect_left(_VOLATILITY_THRESHOLDS, volatility)][1]})"
+
+
+# (indicator key, row label, value formatter, value color or None) in display order
+_GITHUB_METRIC_FIELDS = (
+    ('github_total_commits', 'Total Commits', str, None),
+    ('github_after_hours_percentage', 'After-Hours Commits', lambda v: f"{(v or 0) * 100:.1f}%", None),
+    ('github_weekend_percentage', 'Weekend Commits', lambda v: f"{(v or 0) * 100:.1f}%", None),
+    ('github_commits_per_week', 'Commits/Week', lambda v: f"{v:.1f}", None),
+    ('github_prs_per_week', 'PRs/Week', lambda v: f"{v:.1f}", None),
+    ('github_repositories_touched', 'Repositories Worked On', str, None),
+)
+
+_SLACK_METRIC_FIELDS = (
+    ('slack_messages_per_day', 'Messages/Day', lambda v: f"{v:.1f}", None),
+    ('slack_after_hours_percentage', 'After-Hours Messages', lambda v: f"{v:.1f}%", None),
+    ('slack_weekend_percentage', 'Weekend Messages', lambda v: f"{v:.1f}%", None),
+    ('slack_avg_sentiment', 'Avg Sentiment', _format_sentiment, _sentiment_color),
+    ('slack_negative_sentiment_ratio', 'Negative Messages', lambda v: f"{v:.1f}%", None),
+    ('slack_stress_indicator_ratio', 'Stress Indicators', lambda v: f"{v:.1f}%", None),
+    ('slack_sentiment_volatility', 'Emotional Volatility', _format_volatility, _volatility_color),
+)
+
+# Section name -> (heading, metric fields)
+_METRIC_SECTIONS = {
+    'github': ('💻 GitHub Activity Metrics', _GITHUB_METRIC_FIELDS),
+    'slack': ('💬 Slack Communication Metrics', _SLACK_METRIC_FIELDS),
+}
+
+_SCRIPT_OPEN = _strip_indent("""
+        </div>
+    </div>
+    
+    <script>
+        // Burnout scores bar chart
+        """).encode()
+
+_CHART_SCRIPT = _strip_indent("""        function renderChart(chartData) {
+            const scoresCtx = document.getElementById('scoresChart').getContext('2d');
+            new Chart(scoresCtx, {
+                type: 'bar',
+                data: {
+                    labels: chartData.user_names,
+                    datasets: [
+                        {
+                            label: 'Incident Data',
+                            data: chartData.incident_scores,
+                            backgroundColor: chartData.incident_colors,
+                            borderColor: chartData.incident_colors,
+                            borderWidth: 0
+                        },
+                        {
+                            label: 'GitHub Data',
+                            data: chartData.github_scores,
+                            backgroundColor: chartData.github_colors,
+                            borderColor: chartData.github_colors,
+                            borderWidth: 0
+                        },
+                        {
+                            label: 'Slack Data',
+                            data: chartData.slack_scores,
+                            backgroundColor: chartData.slack_colors,
+                            borderColor: chartData.slack_colors,
+                            borderWidth: 0
+                        }
+                    ]
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    scales: {
+                        x: {
+                            stacked: true
+                        },
+                        y: {
+                            stacked: true,
+                            beginAtZero: true,
+                            max: 10,
+                            ticks: {
+                                stepSize: 2
+                            }
+                        }
+                    },
+                    plugins: {
+                        legend: {
+                            display: true,
+                            position: 'bottom',
+                            labels: {
+                                boxWidth: 12,
+                                padding: 10,
+                                font: {
+                                    size: 11
+                                }
+                            }
+                        },
+                        tooltip: {
+                            mode: 'index',
+                            intersect: false,
+                            callbacks: {
+                                afterTitle: function(context) {
+                                    const dataIndex = context[0].dataIndex;
+                                    const total = context[0].chart.data.datasets.reduce((sum, dataset) => {
+                                        return sum + (dataset.data[dataIndex] || 0);
+                                    }, 0);
+                                    return 'Total Score: ' + total.toFixed(2);
+                                },
+                                label: function(context) {
+                                    const value = context.parsed.y;
+                                    const dataIndex = context.dataIndex;
+                                    const total = context.chart.data.datasets.reduce((sum, dataset) => {
+                                        return sum + (dataset.data[dataIndex] || 0);
+                                    }, 0);
+                                    const percentage = ((value / total) * 100).toFixed(0);
+                                    return context.dataset.label + ': ' + value.toFixed(2) + ' (' + percentage + '% of total)';
+                                }
+                            }
+                        }
+                    },
+                    layout: {
+                        padding: {
+                            top: 10,
+                            bottom: 10
+                        }
+                    }
+                }
+            });
+        }
+        
+""").encode()
+
+_HTML_FOOT = _strip_indent("""        // Toggle user details dropdown
+        function toggleUserDetails(userId) {
+            const detailsElement = document.getElementById('details-' + userId);
+            const arrowElement = event.target;
+            if (detailsElement) {
+                detailsElement.classList.toggle('show');
+                arrowElement.classList.toggle('expanded');
+            }
+        }
+    </script>
+</body>
+</html>
+""").encode()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _load_json(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json.dump writes NaN/Infinity for non-finite floats, which
+            # orjson rejects; the stdlib parser accepts them
+            pass
+    return json.loads(data)
+
+
+def _escape(value: Any) -> str:
+    """HTML-escape a value, using markupsafe's C implementation when it is installed."""
+    if markupsafe_escape is not None:
+        return str(markupsafe_escape(value))
+    return html.escape(str(value))
+
+
+def _js_string(value: str) -> str:
+    """Escape a value for a single-quoted JavaScript string inside an HTML attribute."""
+    return _escape(json.dumps(value)[1:-1].replace("'", "\\'"))
+
+
+@lru_cache(maxsize=32)
+def _metrics_section_template(section: str, present_keys: Tuple[str, ...]) -> str:
+    """Build a metrics section with a placeholder per present metric."""
+    heading, fields = _METRIC_SECTIONS[section]
+    rows = [
+        _COLORED_METRIC_ROW_TEMPLATE.format(label=label, value='{' + key + '}', color='{' + key + '_color}')
+        if color else _METRIC_ROW_TEMPLATE.format(label=label, value='{' + key + '}')
+        for key, label, _, color in fields
+        if key in present_keys
+    ]
+    return _strip_indent("""
+        <div class="detail-section">
+            <div class="detail-label">""" + heading + """</div>""" + "".join(rows) + """
+        </div>""")
+
+
+def _render_metrics_section(section: str, metrics: Dict[str, Any]) -> str:
+    """Render a metrics section, or nothing when the section has no indicators."""
+    if not metrics:
+        return ""
+    
+    # Users usually share the same metric coverage, so the section layout
+    # is built once per distinct key set and only the values are filled in
+    present_keys: List[str] = []
+    values: Dict[str, str] = {}
+    for key, _, formatter, color in _METRIC_SECTIONS[section][1]:
+        value = metrics.get(key)
+        if value is not None:
+            present_keys.append(key)
+            values[key] = formatter(value)
+            if color:
+                values[key + '_color'] = color(value)
+    
+    return _metrics_section_template(section, tuple(present_keys)).format_map(values)
+
+
+def _format_timestamp(timestamp: Any) -> Any:
+    """Format an ISO analysis timestamp for display, falling back to the raw value."""
+    if not isinstance(timestamp, str) or not timestamp or timestamp == 'N/A':
+        return timestamp
+    return _format_iso_timestamp(timestamp)
+
+
+@lru_cache(maxsize=32)
+def _format_iso_timestamp(timestamp: str) -> str:
+    """Format an ISO timestamp string, returning it unchanged if it does not parse."""
+    # fromisoformat accepts a trailing 'Z' natively on the supported Pythons
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return timestamp
+    return dt.strftime('%B %d, %Y at %I:%M %p')
+
+
+class _Aggregate(NamedTuple):
+    """Summary values derived from a single pass over the individual analyses."""
+    counts: Dict[str, int]
+    average_score: float
+    sorted_analyses: List[Dict[str, Any]]
+
+
+class BurnoutDashboard:
+    """Generates HTML dashboard from burnout analysis results."""
+    
+    __slots__ = ('_metadata', '_analyses')
+    
+    def __init__(self, results: Dict[str, Any]) -> None:
+        # Keep only the two sections rendered, not the whole results dict
+        self._metadata: Dict[str, Any] = results.get("metadata") or {}
+        self._analyses: List[Dict[str, Any]] = results.get("individual_analyses") or []
+    
+    def generate_dashboard(self, output_path: str, compress: bool = False, inline_data: bool = True,
+                           inline_css: bool = True) -> None:
+        """Generate complete HTML dashboard, gzip-compressed when compress is set.
+        
+        With inline_data off, the chart data goes to a sibling <name>.data.json
+        file that the page fetches, which needs the dashboard to be served
+        over HTTP rather than opened from disk. With inline_css off, the
+        stylesheet goes to a sibling <name>.css file linked from the page.
+        """
+        html_path = output_path[:-3] if output_path.endswith('.gz') else output_path
+        base_path = os.path.splitext(html_path)[0]
+        data_path: Optional[str] = None if inline_data else base_path + '.data.json'
+        css_path: Optional[str] = None if inline_css else base_path + '.css'
+        
+        # Stream the page through a large write buffer instead of building
+        # one giant string and handing it to the default text layer. Static
+        # segments are pre-encoded bytes; encoding the dynamic chunks with
+        # str.encode() measures the same as a TextIOWrapper over this buffer,
+        # so the simpler binary stream is kept.
+        with open(output_path, 'wb', buffering=1 << 16) as f:
+            if compress:
+                with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6) as gz:
+                    self._write_html(gz, data_path, css_path)
+            else:
+                self._write_html(f, data_path, css_path)
+    
+    def _write_html(self, f: BinaryIO, data_path: Optional[str] = None, css_path: Optional[str] = None) -> None:
+        """Write the complete HTML content to a binary stream.
+        
+        The chart data and stylesheet are written to data_path and css_path
+        instead of being inlined when those are given.
         """
+        individual_analyses = self._analyses
+        metadata = self._metadata
+        
+        # Resolve every metadata value up front rather than inside the templates
+        formatted_timestamp: str = _format_timestamp(metadata.get('analysis_timestamp', 'N/A'))
+        days_analyzed: Any = metadata.get('days_analyzed', 'N/A')
+        total_users: Any = metadata.get('total_users_analyzed', 'N/A')
+        total_incidents: Any = metadata.get('total_incidents', 'N/A')
+        integrations: str = self._get_github_integration_status(metadata) + self._get_slack_integration_status(metadata)
+        
+        if css_path is None:
+            f.write(_HTML_HEAD)
+        else:
+            with open(css_path, 'wb') as css_file:
+                css_file.write(_MINIFIED_CSS)
+            f.write(_HTML_HEAD_OPEN)
+            f.write(_STYLESHEET_LINK_TEMPLATE.format(href=_escape(os.path.basename(css_path))).encode())
+            f.write(_HTML_HEAD_CLOSE)
+        f.write(_HEADER_TEMPLATE.format_map({
+            'formatted_timestamp': formatted_timestamp,
+            'days_analyzed': days_analyzed,
+            'total_users': total_users,
+            'total_incidents': total_incidents,
+            'integrations': integrations
+        }).encode())
+        f.write(_SCORING_NOTE)
+        
+        # Nothing to chart: skip the metrics grid, user list and chart script
+        if not individual_analyses:
+            f.write(_NO_ANALYSES_BODY)
+            return
+        
+        # Counts, average and score ordering in a single pass over the analyses
+        summary = self._aggregate(individual_analyses)
+        
+        f.write(_METRICS_TEMPLATE.format_map({
+            'high_count': summary.counts['high'],
+            'medium_count': summary.counts['medium'],
+            'low_count': summary.counts['low'],
+            'average_score': summary.average_score
+        }).encode())
+        f.write(_USER_LIST_OPEN)
+        chart_data = self._write_user_list(f, summary.sorted_analyses)
+        f.write(_SCRIPT_OPEN)
+        if data_path is None:
+            # '</' would end the inline script early if a name contained it
+            f.write(b"renderChart(")
+            f.write(_dumps(chart_data).replace(b"</", b"<\\/"))
+            f.write(b");\n")
+        else:
+            with open(data_path, 'wb') as data_file:
+                data_file.write(_dumps(chart_data))
+            f.write(f"fetch({_dumps(os.path.basename(data_path)).decode()}).then(response => response.json()).then(renderChart);\n".encode())
+        f.write(_CHART_SCRIPT)
+        f.write(_HTML_FOOT)
+    
+    def _write_user_list(self, f: BinaryIO, sorted_analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Write HTML for user list and return the chart data gathered in the same pass."""
+        user_names: List[str] = []
+        incident_scores: List[float] = []
+        github_scores: List[float] = []
+        slack_scores: List[float] = []
+        incident_colors: List[str] = []
+        github_colors: List[str] = []
+        slack_colors: List[str] = []
+        
+        # Rows go straight to the writer, so peak memory is one row plus the
+        # output buffer rather than the whole list. The chart series are
+        # collected alongside so each analysis is only visited once.
+        for analysis in sorted_analyses:
+            user_name: str = analysis.get('user_name', 'Unknown')
+            score: float = analysis.get('burnout_score', 0)
+            risk_level: str = analysis.get('risk_level', 'low')
+            
+            # One lookup gives the score badge color and the chart bar shades
+            score_class, bg_color, (incident_color, github_color, slack_color) = _RISK_STYLES.get(risk_level, _RISK_STYLES['low'])
+            
+            # GitHub and Slack indicators feed both the chart split and the details
+            github_metrics, slack_metrics = self._split_indicators(analysis.get('dimensions', _EMPTY))
+            
+            # Chart series (already sorted by score, descending)
+            incident_score, github_score, slack_score = self._contribution_scores(
+                analysis, score, bool(github_metrics), bool(slack_metrics)
+            )
+            user_names.append(user_name)
+            incident_scores.append(incident_score)
+            github_scores.append(github_score)
+            slack_scores.append(slack_score)
+            incident_colors.append(incident_color)
+            github_colors.append(github_color)
+            slack_colors.append(slack_color)
+            
+            # Get top recommendation
+            recommendations = analysis.get('recommendations', [])
+            top_rec = recommendations[0] if recommendations else "No specific recommendations"
+            
+            # Generate detailed metrics display
+            user_details = self._generate_user_details(analysis, github_metrics, slack_metrics)
+            
+            # Names, IDs and recommendations come from external data, so they
+            # are escaped before they reach the markup (the details panel
+            # escapes its own ID and email)
+            user_id = str(analysis.get('user_id', ''))
+            f.write(f"""
+            <div class="user-item">
+                <div style="flex: 1;">
+                    <div style="display: flex; align-items: center;">
+                        <span class="expand-arrow" onclick="toggleUserDetails('{_js_string(user_id)}')">▶</span>
+                        <div class="user-name">{_escape(user_name)}</div>
+                    </div>
+                    <div style="font-size: 0.8em; color: #666; margin-top: 4px;">{_escape(top_rec)}</div>
+                    <div id="details-{_escape(user_id)}" class="user-details">
+                        {user_details}
+                    </div>
+                </div>
+                <div class="user-score" style="background-color: {bg_color}">{score}</div>
+            </div>
+            """.encode())
         
-        return details_html
+        return {
+            'user_names': user_names,
+            'incident_scores': incident_scores,
+            'github_scores': github_scores,
+            'slack_scores': slack_scores,
+            'incident_colors': incident_colors,
+            'github_colors': github_colors,
+            'slack_colors': slack_colors
+        }
     
-    def _count_risk_level(self, analyses: List[Dict[str, Any]], risk_level: str) -> int:
-        """Count users at a specific risk level."""
-        return sum(1 for analysis in analyses if analysis.get('risk_level') == risk_level)
+    def _contribution_scores(self, analysis: Dict[str, Any], burnout_score: float,
+                             has_github: bool, has_slack: bool) -> Tuple[float, float, float]:
+        """Split a burnout score into stacked incident/GitHub/Slack chart segments."""
+        data_source_contributions: Dict[str, float] = analysis.get('data_source_contributions', _EMPTY)
+        
+        # If we have detailed contributions, use them
+        if data_source_contributions:
+            return (
+                round(data_source_contributions.get('incident', burnout_score * 0.7), 2),
+                round(data_source_contributions.get('github', 0), 2),
+                round(data_source_contributions.get('slack', 0), 2)
+            )
+        
+        # Estimate based on whether integrations were used
+        if has_github and has_slack:
+            # All three sources
+            return round(burnout_score * 0.7, 2), round(burnout_score * 0.15, 2), round(burnout_score * 0.15, 2)
+        elif has_github:
+            # Incident + GitHub
+            return round(burnout_score * 0.85, 2), round(burnout_score * 0.15, 2), 0
+        elif has_slack:
+            # Incident + Slack
+            return round(burnout_score * 0.85, 2), 0, round(burnout_score * 0.15, 2)
+        else:
+            # Incident only
+            return round(burnout_score, 2), 0, 0
     
-    def _calculate_average_score(self, analyses: List[Dict[str, Any]]) -> float:
-        """Calculate average burnout score across all users."""
-        if not analyses:
-            return 0.0
-        scores = [analysis.get('burnout_score', 0) for analysis in analyses]
-        return round(sum(scores) / len(scores), 2)
+    def _generate_user_details(self, analysis: Dict[str, Any], github_metrics: Dict[str, Any],
+                               slack_metrics: Dict[str, Any]) -> str:
+        """Generate detailed metrics for a user."""
+        user_id: Any = analysis.get('user_id', '')
+        user_email: Any = analysis.get('user_email', '')
+        key_metrics: Dict[str, Any] = analysis.get('key_metrics', _EMPTY)
+        dimensions: Dict[str, Any] = analysis.get('dimensions', _EMPTY)
+        
+        # Format key metrics
+        total_incidents: int = key_metrics.get('total_incidents', 0)
+        incidents_per_week: float = key_metrics.get('incidents_per_week', 0)
+        after_hours_incidents: int = key_metrics.get('after_hours_incidents', 0)
+        avg_resolution_time: float = key_metrics.get('avg_resolution_time_hours', 0)
+        resolution_success_rate: float = key_metrics.get('resolution_success_rate', 0)
+        
+        # Format resolution time as hours and minutes
+        hours, minutes = divmod(int(avg_resolution_time * 60), 60)
+        if hours and minutes:
+            resolution_time_display = f"{hours}h {minutes}m"
+        elif hours:
+            resolution_time_display = f"{hours}h"
+        else:
+            resolution_time_display = f"{minutes}m"
+        
+        # Format dimension scores
+        emotional_exhaustion: float = dimensions.get('emotional_exhaustion', _EMPTY).get('score', 0)
+        depersonalization: float = dimensions.get('depersonalization', _EMPTY).get('score', 0)
+        personal_accomplishment: float = dimensions.get('personal_accomplishment', _EMPTY).get('score', 0)
+        
+        return _USER_DETAILS_TEMPLATE.format_map({
+            'user_id': _escape(user_id),
+            'user_email': _escape(user_email),
+            'total_incidents': total_incidents,
+            'incidents_per_week': incidents_per_week,
+            'after_hours_incidents': after_hours_incidents,
+            'resolution_time_display': resolution_time_display,
+            'resolution_success_rate': resolution_success_rate,
+            'emotional_exhaustion': emotional_exhaustion,
+            'depersonalization': depersonalization,
+            'personal_accomplishment': personal_accomplishment,
+            'github_section': _render_metrics_section('github', github_metrics),
+            'slack_section': _render_metrics_section('slack', slack_metrics)
+        })
+    
+    def _aggregate(self, analyses: List[Dict[str, Any]]) -> _Aggregate:
+        """Compute risk-level counts, average score and score ordering in one pass."""
+        counts: Dict[str, int] = {'high': 0, 'medium': 0, 'low': 0}
+        for analysis in analyses:
+            risk_level = analysis.get('risk_level')
+            if risk_level in counts:
+                counts[risk_level] += 1
+        
+        # Extract scores once and let the C-level builtins do the reductions
+        scores: List[float] = [analysis.get('burnout_score', 0) for analysis in analyses]
+        total_score: float = sum(scores)
+        
+        # Sort on the precomputed score so the key is a C-level itemgetter
+        # rather than a lambda doing a dict lookup per comparison
+        scored = sorted(zip(scores, analyses), key=itemgetter(0), reverse=True)
+        
+        average_score: float = round(total_score / len(analyses), 2) if analyses else 0.0
+        sorted_analyses = [analysis for _, analysis in scored]
+        
+        return _Aggregate(counts, average_score, sorted_analyses)
     
     def _get_github_integration_status(self, metadata: Dict[str, Any]) -> str:
         """Get GitHub integration status display text."""
@@ -629,184 +922,24 @@ class BurnoutDashboard:
         else:
             return ''
     
-    def _generate_github_metrics_section(self, dimensions: Dict[str, Any]) -> str:
-        """Generate GitHub metrics section if GitHub data is available."""
-        # Check if any dimension has GitHub indicators
-        has_github_data = False
-        github_metrics = {}
-        
-        for dimension_name, dimension_data in dimensions.items():
-            indicators = dimension_data.get('indicators', {})
-            for key, value in indicators.items():
-                if key.startswith('github_') and value is not None:
-                    has_github_data = True
+    def _split_indicators(self, dimensions: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Partition non-empty indicators across all dimensions into GitHub and Slack metrics."""
+        github_metrics: Dict[str, Any] = {}
+        slack_metrics: Dict[str, Any] = {}
+        for dimension_data in dimensions.values():
+            for key, value in dimension_data.get('indicators', _EMPTY).items():
+                if value is None:
+                    continue
+                if key.startswith('github_'):
                     github_metrics[key] = value
-        
-        if not has_github_data:
-            return ""
-        
-        # Format GitHub metrics for display
-        html = """
-        <div class="detail-section">
-            <div class="detail-label">💻 GitHub Activity Metrics</div>"""
-        
-        # Add relevant GitHub metrics
-        if 'github_total_commits' in github_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>Total Commits:</span>
-                <span><strong>{github_metrics['github_total_commits']}</strong></span>
-            </div>"""
-        
-        if 'github_after_hours_percentage' in github_metrics:
-            percentage = github_metrics['github_after_hours_percentage'] * 100 if github_metrics['github_after_hours_percentage'] else 0
-            html += f"""
-            <div class="metric-row">
-                <span>After-Hours Commits:</span>
-                <span><strong>{percentage:.1f}%</strong></span>
-            </div>"""
-        
-        if 'github_weekend_percentage' in github_metrics:
-            percentage = github_metrics['github_weekend_percentage'] * 100 if github_metrics['github_weekend_percentage'] else 0
-            html += f"""
-            <div class="metric-row">
-                <span>Weekend Commits:</span>
-                <span><strong>{percentage:.1f}%</strong></span>
-            </div>"""
-        
-        if 'github_commits_per_week' in github_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>Commits/Week:</span>
-                <span><strong>{github_metrics['github_commits_per_week']:.1f}</strong></span>
-            </div>"""
-        
-        if 'github_prs_per_week' in github_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>PRs/Week:</span>
-                <span><strong>{github_metrics['github_prs_per_week']:.1f}</strong></span>
-            </div>"""
-        
-        if 'github_repositories_touched' in github_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>Repositories Worked On:</span>
-                <span><strong>{github_metrics['github_repositories_touched']}</strong></span>
-            </div>"""
-        
-        html += """
-        </div>"""
-        
-        return html
-    
-    def _generate_slack_metrics_section(self, dimensions: Dict[str, Any]) -> str:
-        """Generate Slack metrics section if Slack data is available."""
-        # Check if any dimension has Slack indicators
-        has_slack_data = False
-        slack_metrics = {}
-        
-        for dimension_name, dimension_data in dimensions.items():
-            indicators = dimension_data.get('indicators', {})
-            for key, value in indicators.items():
-                if key.startswith('slack_') and value is not None:
-                    has_slack_data = True
+                elif key.startswith('slack_'):
                     slack_metrics[key] = value
-        
-        if not has_slack_data:
-            return ""
-        
-        # Format Slack metrics for display
-        html = """
-        <div class="detail-section">
-            <div class="detail-label">💬 Slack Communication Metrics</div>"""
-        
-        # Add relevant Slack metrics
-        if 'slack_messages_per_day' in slack_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>Messages/Day:</span>
-                <span><strong>{slack_metrics['slack_messages_per_day']:.1f}</strong></span>
-            </div>"""
-        
-        if 'slack_after_hours_percentage' in slack_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>After-Hours Messages:</span>
-                <span><strong>{slack_metrics['slack_after_hours_percentage']:.1f}%</strong></span>
-            </div>"""
-        
-        if 'slack_weekend_percentage' in slack_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>Weekend Messages:</span>
-                <span><strong>{slack_metrics['slack_weekend_percentage']:.1f}%</strong></span>
-            </div>"""
-        
-        if 'slack_avg_sentiment' in slack_metrics:
-            sentiment = slack_metrics['slack_avg_sentiment']
-            sentiment_color = '#28a745' if sentiment > 0.1 else '#ffc107' if sentiment > -0.1 else '#dc3545'
-            sentiment_label = 'Positive' if sentiment > 0.1 else 'Neutral' if sentiment > -0.1 else 'Negative'
-            html += f"""
-            <div class="metric-row">
-                <span>Avg Sentiment:</span>
-                <span><strong style="color: {sentiment_color};">{sentiment:.2f} ({sentiment_label})</strong></span>
-            </div>"""
-        
-        if 'slack_negative_sentiment_ratio' in slack_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>Negative Messages:</span>
-                <span><strong>{slack_metrics['slack_negative_sentiment_ratio']:.1f}%</strong></span>
-            </div>"""
-        
-        if 'slack_stress_indicator_ratio' in slack_metrics:
-            html += f"""
-            <div class="metric-row">
-                <span>Stress Indicators:</span>
-                <span><strong>{slack_metrics['slack_stress_indicator_ratio']:.1f}%</strong></span>
-            </div>"""
-        
-        if 'slack_sentiment_volatility' in slack_metrics:
-            volatility = slack_metrics['slack_sentiment_volatility']
-            volatility_color = '#dc3545' if volatility > 0.4 else '#ffc107' if volatility > 0.2 else '#28a745'
-            volatility_label = 'High' if volatility > 0.4 else 'Moderate' if volatility > 0.2 else 'Low'
-            html += f"""
-            <div class="metric-row">
-                <span>Emotional Volatility:</span>
-                <span><strong style="color: {volatility_color};">{volatility:.2f} ({volatility_label})</strong></span>
-            </div>"""
-        
-        html += """
-        </div>"""
-        
-        return html
-    
-    def _has_github_data(self, analysis: Dict[str, Any]) -> bool:
-        """Check if analysis includes GitHub data."""
-        dimensions = analysis.get('dimensions', {})
-        for dimension in dimensions.values():
-            indicators = dimension.get('indicators', {})
-            for key in indicators:
-                if key.startswith('github_') and indicators[key] is not None:
-                    return True
-        return False
-    
-    def _has_slack_data(self, analysis: Dict[str, Any]) -> bool:
-        """Check if analysis includes Slack data."""
-        dimensions = analysis.get('dimensions', {})
-        for dimension in dimensions.values():
-            indicators = dimension.get('indicators', {})
-            for key in indicators:
-                if key.startswith('slack_') and indicators[key] is not None:
-                    return True
-        return False
-
-
-def generate_dashboard_from_file(results_file: str, output_file: str):
+        return github_metrics, slack_metrics
+
+
+def generate_dashboard_from_file(results_file: str, output_file: str) -> None:
     """Generate dashboard from saved results file."""
-    with open(results_file) as f:
-        results = json.load(f)
+    results = _load_json(results_file)
     
     dashboard = BurnoutDashboard(results)
     dashboard.generate_dashboard(output_file)
@@ -4,14 +4,100 @@ GitHub data collector for fetching code activity metrics.
 
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# GitHub's documented search API quota for authenticated requests
+SEARCH_REQUESTS_PER_MINUTE = 30
+
+SEARCH_COMMITS_URL = 'https://api.github.com/search/commits'
+SEARCH_ISSUES_URL = 'https://api.github.com/search/issues'
+GRAPHQL_URL = 'https://api.github.com/graphql'
+
+# Fields requested for each PR/issue search alias in the GraphQL activity query
+_GRAPHQL_SEARCH_FIELDS = """
+    issueCount
+    nodes {
+      ... on PullRequest {
+        number title state createdAt updatedAt closedAt isDraft
+        repository { name }
+        labels(first: 20) { nodes { name } }
+      }
+      ... on Issue {
+        number title state createdAt updatedAt closedAt
+        repository { name }
+        labels(first: 20) { nodes { name } }
+      }
+    }
+"""
+
+
+def _dumps(obj) -> bytes:
+    """Serialize compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a GitHub ISO-8601 timestamp; repeated strings are parsed once."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing bursts up to capacity."""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= 1
+    
+    def penalize(self, seconds: float):
+        """Empty the bucket so no request is made for the given number of seconds."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0) - seconds * self.refill_rate
+
 
 class GitHubCollector:
     """Collects GitHub activity data for burnout analysis."""
@@ -22,16 +108,49 @@ class GitHubCollector:
         self.config = config
         self.github_config = config.get('github_integration', {})
         self.organizations = self.github_config.get('organizations', ['Rootly-AI-Labs', 'rootlyhq'])
+        # Repeated org: qualifiers are OR'ed, so one search covers every org
+        self.org_qualifier = ' '.join(f'org:{org}' for org in self.organizations)
         self.refresh_cache = config.get('_refresh_github_cache', False)
         self.cache_dir = Path('.github_cache')
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Business hours configuration
         self.business_hours = config.get('analysis', {}).get('business_hours', {'start': 9, 'end': 17})
-        
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # 100ms between requests
+        # Bit (weekday * 24 + hour) is set for each weekday business hour
+        start, end = self.business_hours['start'], self.business_hours['end']
+        self._business_hours_mask = 0
+        for day in range(5):
+            for hour in range(24):
+                if start <= hour < end:
+                    self._business_hours_mask |= 1 << (day * 24 + hour)
+        
+        # Rate limiting: search requests may burst up to the per-minute quota
+        self.search_bucket = _TokenBucket(SEARCH_REQUESTS_PER_MINUTE, SEARCH_REQUESTS_PER_MINUTE / 60)
+        
+        # Users are collected concurrently; requests share the search bucket
+        try:
+            max_workers = int(self.github_config.get('max_workers', 4))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid github_integration.max_workers {self.github_config['max_workers']!r}, using 4")
+            max_workers = 4
+        self.max_workers = max(1, max_workers)
+        
+        # One pooled session so connections to api.github.com are reused
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_workers,
+            # Rate-limit responses (and their Retry-After) are left to the caller
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                              respect_retry_after_header=False)
+        )
+        self.session.mount('https://', adapter)
+        
+        # ETags and bodies of earlier search responses, revalidated with If-None-Match
+        self.etag_file = self.cache_dir / 'etags.json'
+        self._etags = self._load_etags()
+        self._used_etag_keys = set()
         
     def collect_github_data(self, github_correlations: Dict[str, str], days: int = 30) -> Dict[str, Dict]:
         """
@@ -57,29 +176,40 @@ class GitHubCollector:
         # Set up date range
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
+        date_range = f'{start_date:%Y-%m-%d}..{end_date:%Y-%m-%d}'
         
         logger.info(f"Collecting GitHub data from {start_date.date()} to {end_date.date()}")
         
-        # Collect data for each user
+        # Collect data for each user, overlapping request latency across users
         github_data = {}
+        total = len(matched_users)
         
-        for i, (rootly_email, github_username) in enumerate(matched_users.items(), 1):
-            logger.info(f"[{i}/{len(matched_users)}] Collecting data for {github_username}")
+        def collect(item):
+            i, (rootly_email, github_username) = item
+            logger.info(f"[{i}/{total}] Collecting data for {github_username}")
             
             try:
-                user_data = self._collect_user_activity(
-                    github_username, start_date, end_date, rootly_email
+                return github_username, self._collect_user_activity(
+                    github_username, start_date, end_date, date_range, rootly_email
                 )
-                github_data[github_username] = user_data
-                
             except Exception as e:
                 logger.error(f"Failed to collect data for {github_username}: {e}")
-                github_data[github_username] = self._empty_user_data()
+                return github_username, self._empty_user_data()
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, total)) as pool:
+            for github_username, user_data in pool.map(collect, enumerate(matched_users.items(), 1)):
+                github_data[github_username] = user_data
+        
+        self._save_etags()
         
         logger.info(f"GitHub data collection complete for {len(github_data)} users")
         return github_data
     
-    def _collect_user_activity(self, username: str, start_date: datetime, end_date: datetime, rootly_email: str) -> Dict:
+    def close(self):
+        """Release pooled HTTP connections."""
+        self.session.close()
+    
+    def _collect_user_activity(self, username: str, start_date: datetime, end_date: datetime, date_range: str, rootly_email: str) -> Dict:
         """Collect all activity data for a single user."""
         
         # Check cache first
@@ -87,10 +217,9 @@ class GitHubCollector:
         
         if cache_file.exists() and not self.refresh_cache:
             try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                    logger.debug(f"Loaded cached GitHub data for {username}")
-                    return cached_data
+                cached_data = _loads(cache_file.read_bytes())
+                logger.debug(f"Loaded cached GitHub data for {username}")
+                return cached_data
             except Exception as e:
                 logger.warning(f"Failed to load cache for {username}: {e}")
         
@@ -111,128 +240,187 @@ class GitHubCollector:
         }
         
         # Collect commits
-        commits = self._get_user_commits(username, start_date, end_date)
+        commits = self._get_user_commits(username, date_range)
         user_data['commits'] = commits
         
-        # Collect pull requests
-        pull_requests = self._get_user_pull_requests(username, start_date, end_date)
+        # Collect pull requests and assigned issues in one GraphQL request,
+        # falling back to per-org REST searches
+        activity = self._graphql_user_activity(username, date_range)
+        if activity is not None:
+            pull_requests, issues = activity
+        else:
+            pull_requests = self._get_user_pull_requests(username, date_range)
+            issues = self._get_user_issues(username, date_range)
         user_data['pull_requests'] = pull_requests
+        user_data['issues'] = issues
         
         # Collect PR reviews
         reviews = self._get_user_reviews(username, start_date, end_date)
         user_data['reviews'] = reviews
         
-        # Collect assigned issues
-        issues = self._get_user_issues(username, start_date, end_date)
-        user_data['issues'] = issues
-        
         # Calculate metrics
         user_data['metrics'] = self._calculate_metrics(user_data)
         
         # Cache the results
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(user_data, f, indent=2)
+            cache_file.write_bytes(_dumps(user_data))
             logger.debug(f"Cached GitHub data for {username}")
+            self._prune_activity_cache(username, cache_file)
         except Exception as e:
             logger.warning(f"Failed to cache data for {username}: {e}")
         
         return user_data
     
-    def _get_user_commits(self, username: str, start_date: datetime, end_date: datetime) -> List[Dict]:
+    def _prune_activity_cache(self, username: str, current_file: Path):
+        """Remove a user's cached activity for windows that ended before the current one.
+        
+        Files ending on the same day (e.g. from a different --days value) are kept.
+        """
+        current_end = current_file.stem.rsplit('_', 1)[1]
+        for stale_file in self.cache_dir.glob(f"activity_{username}_????????_????????.json"):
+            if stale_file.stem.rsplit('_', 1)[1] < current_end:
+                stale_file.unlink(missing_ok=True)
+                logger.debug(f"Removed superseded cache file {stale_file.name}")
+    
+    def _get_user_commits(self, username: str, date_range: str) -> List[Dict]:
         """Get all commits by user using GitHub's search API (much faster)."""
         commits = []
         
-        # Search each organization separately to avoid complex query issues
-        for org in self.organizations:
-            org_query = f'author:{username} org:{org} committer-date:{start_date.strftime("%Y-%m-%d")}..{end_date.strftime("%Y-%m-%d")}'
-            
-            self._rate_limit()
+        query = f'author:{username} {self.org_qualifier} committer-date:{date_range}'
+        
+        try:
+            data = self._search(
+                SEARCH_COMMITS_URL,
+                {'q': query, 'per_page': 100, 'sort': 'committer-date', 'order': 'asc'},
+                f"commits for {username}",
+                headers={'Accept': 'application/vnd.github.cloak-preview'}
+            )
+            if data is None:
+                return commits
             
-            try:
-                response = requests.get(
-                    'https://api.github.com/search/commits',
-                    headers={**self.headers, 'Accept': 'application/vnd.github.cloak-preview'},
-                    params={'q': org_query, 'per_page': 100, 'sort': 'committer-date', 'order': 'asc'}
-                )
+            for commit_item in data.get('items', []):
+                commit = commit_item['commit']
+                repo_name = commit_item['repository']['full_name']
                 
-                if response.status_code != 200:
-                    logger.warning(f"Failed to search commits for {username} in {org}: {response.status_code}")
-                    continue
+                commit_data = {
+                    'sha': commit_item['sha'],
+                    'date': commit['author']['date'],
+                    'message': commit['message'],
+                    'repository': repo_name,
+                    'additions': 0,  # Search API doesn't include stats
+                    'deletions': 0,
+                    'changed_files': 0
+                }
                 
-                data = response.json()
+                # Parse date and check if it's in business hours
+                commit_dt = _parse_timestamp(commit_data['date'])
+                commit_data['is_business_hours'] = self._is_business_hours(commit_dt)
+                commit_data['is_weekend'] = commit_dt.weekday() >= 5
                 
-                for commit_item in data.get('items', []):
-                    commit = commit_item['commit']
-                    repo_name = commit_item['repository']['full_name']
-                    
-                    commit_data = {
-                        'sha': commit_item['sha'],
-                        'date': commit['author']['date'],
-                        'message': commit['message'],
-                        'repository': repo_name,
-                        'additions': 0,  # Search API doesn't include stats
-                        'deletions': 0,
-                        'changed_files': 0
-                    }
-                    
-                    # Parse date and check if it's in business hours
-                    commit_dt = datetime.fromisoformat(commit_data['date'].replace('Z', '+00:00'))
-                    commit_data['is_business_hours'] = self._is_business_hours(commit_dt)
-                    commit_data['is_weekend'] = commit_dt.weekday() >= 5
-                    
-                    commits.append(commit_data)
-                    
-            except Exception as e:
-                logger.error(f"Error searching commits for {username} in {org}: {e}")
+                commits.append(commit_data)
+        
+        except Exception as e:
+            logger.error(f"Error searching commits for {username}: {e}")
         
         return commits
     
-    def _get_user_pull_requests(self, username: str, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Get pull requests created by user using search API."""
-        pull_requests = []
+    def _graphql_user_activity(self, username: str, date_range: str) -> Optional[Tuple[List[Dict], List[Dict]]]:
+        """Get PRs and assigned issues in a single GraphQL request.
         
-        # Search each organization separately
-        for org in self.organizations:
-            query = f'author:{username} type:pr org:{org} created:{start_date.strftime("%Y-%m-%d")}..{end_date.strftime("%Y-%m-%d")}'
+        Returns None when the query fails or any result set is truncated, so the
+        caller can fall back to the REST search API.
+        """
+        pr_query = json.dumps(f'author:{username} type:pr {self.org_qualifier} created:{date_range}')
+        issue_query = json.dumps(f'assignee:{username} type:issue {self.org_qualifier} created:{date_range}')
+        searches = [
+            f'prs: search(query: {pr_query}, type: ISSUE, first: 100) {{{_GRAPHQL_SEARCH_FIELDS}}}',
+            f'issues: search(query: {issue_query}, type: ISSUE, first: 100) {{{_GRAPHQL_SEARCH_FIELDS}}}',
+        ]
+        
+        # GraphQL has its own point-based quota, separate from the search bucket
+        try:
+            response = self.session.post(
+                GRAPHQL_URL,
+                json={'query': '{\n' + '\n'.join(searches) + '\n}'}
+            )
             
-            self._rate_limit()
+            if response.status_code != 200:
+                logger.debug(f"GraphQL activity query failed for {username}: {response.status_code}")
+                return None
             
-            try:
-                response = requests.get(
-                    'https://api.github.com/search/issues',
-                    headers=self.headers,
-                    params={'q': query, 'per_page': 100}
-                )
-                
-                if response.status_code != 200:
-                    logger.warning(f"Failed to search PRs for {username} in {org}: {response.status_code}")
-                    continue
-                
-                data = response.json()
+            payload = _loads(response.content)
+            if payload.get('errors') or not payload.get('data'):
+                logger.debug(f"GraphQL activity query returned errors for {username}: {payload.get('errors')}")
+                return None
+            
+            pull_requests = []
+            issues = []
+            for alias, result in payload['data'].items():
+                nodes = result['nodes']
+                if result['issueCount'] > len(nodes):
+                    logger.debug(f"GraphQL results truncated for {username} ({alias}), using REST search")
+                    return None
                 
-                for pr in data.get('items', []):
-                    pr_data = {
-                        'number': pr['number'],
-                        'title': pr['title'],
-                        'state': pr['state'],
-                        'created_at': pr['created_at'],
-                        'updated_at': pr['updated_at'],
-                        'closed_at': pr['closed_at'],
-                        'repository': pr['repository_url'].split('/')[-1],
-                        'labels': [label['name'] for label in pr.get('labels', [])],
-                        'draft': pr.get('draft', False)
+                for node in nodes:
+                    item_data = {
+                        'number': node['number'],
+                        'title': node['title'],
+                        'state': 'open' if node['state'] == 'OPEN' else 'closed',
+                        'created_at': node['createdAt'],
+                        'updated_at': node['updatedAt'],
+                        'closed_at': node['closedAt'],
+                        'repository': node['repository']['name'],
+                        'labels': [label['name'] for label in node['labels']['nodes']],
                     }
                     
-                    # Parse date and check business hours
-                    created_dt = datetime.fromisoformat(pr_data['created_at'].replace('Z', '+00:00'))
-                    pr_data['is_business_hours'] = self._is_business_hours(created_dt)
-                    pr_data['is_weekend'] = created_dt.weekday() >= 5
-                    
-                    pull_requests.append(pr_data)
-                    
-            except Exception as e:
-                logger.error(f"Error searching PRs for {username} in {org}: {e}")
+                    if alias == 'prs':
+                        item_data['draft'] = node.get('isDraft', False)
+                        created_dt = _parse_timestamp(item_data['created_at'])
+                        item_data['is_business_hours'] = self._is_business_hours(created_dt)
+                        item_data['is_weekend'] = created_dt.weekday() >= 5
+                        pull_requests.append(item_data)
+                    else:
+                        issues.append(item_data)
+            
+            return pull_requests, issues
+            
+        except Exception as e:
+            logger.debug(f"GraphQL activity query failed for {username}: {e}")
+            return None
+    
+    def _get_user_pull_requests(self, username: str, date_range: str) -> List[Dict]:
+        """Get pull requests created by user using search API."""
+        pull_requests = []
+        
+        query = f'author:{username} type:pr {self.org_qualifier} created:{date_range}'
+        
+        try:
+            data = self._search(SEARCH_ISSUES_URL, {'q': query, 'per_page': 100}, f"PRs for {username}")
+            if data is None:
+                return pull_requests
+            
+            for pr in data.get('items', []):
+                pr_data = {
+                    'number': pr['number'],
+                    'title': pr['title'],
+                    'state': pr['state'],
+                    'created_at': pr['created_at'],
+                    'updated_at': pr['updated_at'],
+                    'closed_at': pr['closed_at'],
+                    'repository': pr['repository_url'].split('/')[-1],
+                    'labels': [label['name'] for label in pr.get('labels', [])],
+                    'draft': pr.get('draft', False)
+                }
+                
+                # Parse date and check business hours
+                created_dt = _parse_timestamp(pr_data['created_at'])
+                pr_data['is_business_hours'] = self._is_business_hours(created_dt)
+                pr_data['is_weekend'] = created_dt.weekday() >= 5
+                
+                pull_requests.append(pr_data)
+        
+        except Exception as e:
+            logger.error(f"Error searching PRs for {username}: {e}")
         
         return pull_requests
     
@@ -247,48 +435,110 @@ class GitHubCollector:
         
         return reviews
     
-    def _get_user_issues(self, username: str, start_date: datetime, end_date: datetime) -> List[Dict]:
+    def _get_user_issues(self, username: str, date_range: str) -> List[Dict]:
         """Get issues assigned to user using search API."""
         issues = []
         
-        # Search each organization separately
-        for org in self.organizations:
-            query = f'assignee:{username} type:issue org:{org} created:{start_date.strftime("%Y-%m-%d")}..{end_date.strftime("%Y-%m-%d")}'
-            
-            self._rate_limit()
+        query = f'assignee:{username} type:issue {self.org_qualifier} created:{date_range}'
+        
+        try:
+            data = self._search(SEARCH_ISSUES_URL, {'q': query, 'per_page': 100}, f"issues for {username}")
+            if data is None:
+                return issues
             
-            try:
-                response = requests.get(
-                    'https://api.github.com/search/issues',
-                    headers=self.headers,
-                    params={'q': query, 'per_page': 100}
-                )
-                
-                if response.status_code != 200:
-                    logger.warning(f"Failed to search issues for {username} in {org}: {response.status_code}")
-                    continue
+            for issue in data.get('items', []):
+                issue_data = {
+                    'number': issue['number'],
+                    'title': issue['title'],
+                    'state': issue['state'],
+                    'created_at': issue['created_at'],
+                    'updated_at': issue['updated_at'],
+                    'closed_at': issue['closed_at'],
+                    'repository': issue['repository_url'].split('/')[-1],
+                    'labels': [label['name'] for label in issue.get('labels', [])],
+                }
                 
-                data = response.json()
-                
-                for issue in data.get('items', []):
-                    issue_data = {
-                        'number': issue['number'],
-                        'title': issue['title'],
-                        'state': issue['state'],
-                        'created_at': issue['created_at'],
-                        'updated_at': issue['updated_at'],
-                        'closed_at': issue['closed_at'],
-                        'repository': issue['repository_url'].split('/')[-1],
-                        'labels': [label['name'] for label in issue.get('labels', [])],
-                    }
-                    
-                    issues.append(issue_data)
-                    
-            except Exception as e:
-                logger.error(f"Error searching issues for {username} in {org}: {e}")
+                issues.append(issue_data)
+        
+        except Exception as e:
+            logger.error(f"Error searching issues for {username}: {e}")
         
         return issues
     
+    def _search(self, url: str, params: Dict, description: str, headers: Optional[Dict] = None) -> Optional[Dict]:
+        """Run a search API request across all result pages.
+        
+        The stored body is reused when GitHub answers 304 for the first page.
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}"
+        self._used_etag_keys.add(key)
+        cached = self._etags.get(key)
+        headers = headers or {}
+        first_page_headers = {**headers, 'If-None-Match': cached['etag']} if cached else headers
+        
+        self._rate_limit()
+        
+        response = self.session.get(url, headers=first_page_headers, params=params)
+        
+        if response.status_code == 304 and cached:
+            logger.debug(f"Search results unchanged for {description}")
+            return cached['data']
+        
+        if response.status_code != 200:
+            self._handle_rate_limited(response)
+            logger.warning(f"Failed to search {description}: {response.status_code}")
+            return None
+        
+        data = _loads(response.content)
+        etag = response.headers.get('ETag')
+        
+        # Follow the Link header so results beyond the first page are not dropped
+        next_url = response.links.get('next', {}).get('url')
+        while next_url:
+            self._rate_limit()
+            response = self.session.get(next_url, headers=headers)
+            
+            if response.status_code != 200:
+                self._handle_rate_limited(response)
+                logger.warning(f"Failed to fetch more results for {description}: {response.status_code}")
+                etag = None  # Don't revalidate against a partial result
+                break
+            
+            data.setdefault('items', []).extend(_loads(response.content).get('items', []))
+            next_url = response.links.get('next', {}).get('url')
+        
+        if len(data.get('items', [])) < data.get('total_count', 0):
+            logger.warning(f"Search for {description} returned only {len(data.get('items', []))} "
+                           f"of {data['total_count']} results")
+        
+        if etag:
+            self._etags[key] = {'etag': etag, 'data': data}
+        return data
+    
+    def _load_etags(self) -> Dict:
+        """Load stored search ETags and response bodies."""
+        if not self.etag_file.exists():
+            return {}
+        try:
+            return _loads(self.etag_file.read_bytes())
+        except Exception as e:
+            logger.warning(f"Failed to load GitHub ETag cache: {e}")
+            return {}
+    
+    def _save_etags(self):
+        """Persist search ETags so later runs can make conditional requests.
+        
+        Only queries made during this run are kept; the date window is part of
+        every query, so entries for earlier windows would never be read again.
+        """
+        if not self._used_etag_keys:
+            return
+        
+        etags = {key: self._etags[key] for key in self._used_etag_keys if key in self._etags}
+        try:
+            self.etag_file.write_bytes(_dumps(etags))
+        except Exception as e:
+            logger.warning(f"Failed to save GitHub ETag cache: {e}")
     
     def _calculate_metrics(self, user_data: Dict) -> Dict:
         """Calculate burnout-relevant metrics from GitHub activity."""
@@ -302,12 +552,19 @@ class GitHubCollector:
         total_issues = len(issues)
         
         # Time-based analysis
-        after_hours_commits = len([c for c in commits if not c['is_business_hours']])
-        weekend_commits = len([c for c in commits if c['is_weekend']])
-        after_hours_prs = len([pr for pr in pull_requests if not pr['is_business_hours']])
+        after_hours_commits = 0
+        weekend_commits = 0
+        repositories = set()
+        for c in commits:
+            if not c['is_business_hours']:
+                after_hours_commits += 1
+            if c['is_weekend']:
+                weekend_commits += 1
+            repositories.add(c['repository'])
+        after_hours_prs = total_prs - sum(pr['is_business_hours'] for pr in pull_requests)
         
         # Patterns
-        repositories_touched = len(set(c['repository'] for c in commits))
+        repositories_touched = len(repositories)
         
         # Calculate percentages
         after_hours_commit_percentage = (after_hours_commits / total_commits) if total_commits > 0 else 0
@@ -348,33 +605,35 @@ class GitHubCollector:
         clustered = 0
         cluster_window = timedelta(hours=4)
         
-        for i in range(1, len(commits)):
-            current_time = datetime.fromisoformat(commits[i]['date'].replace('Z', '+00:00'))
-            previous_time = datetime.fromisoformat(commits[i-1]['date'].replace('Z', '+00:00'))
+        previous_time = _parse_timestamp(commits[0]['date'])
+        for commit in commits[1:]:
+            current_time = _parse_timestamp(commit['date'])
             
             if current_time - previous_time <= cluster_window:
                 clustered += 1
+            previous_time = current_time
         
         return clustered
     
     def _is_business_hours(self, dt: datetime) -> bool:
         """Check if datetime is within business hours (assumes UTC for simplicity)."""
         # Convert to local time (this is simplified - in reality we'd want user timezone)
-        hour = dt.hour
-        is_weekday = dt.weekday() < 5
-        
-        return (is_weekday and 
-                self.business_hours['start'] <= hour < self.business_hours['end'])
+        return bool(self._business_hours_mask >> (dt.weekday() * 24 + dt.hour) & 1)
     
     def _rate_limit(self):
-        """Simple rate limiting to avoid hitting GitHub API limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-        
-        self.last_request_time = time.time()
+        """Wait for a search API token to avoid hitting GitHub API limits."""
+        self.search_bucket.acquire()
+    
+    def _handle_rate_limited(self, response):
+        """Hold off further searches when GitHub reports the quota is exhausted."""
+        if response.status_code not in (403, 429):
+            return
+        
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None and response.headers.get('X-RateLimit-Remaining') == '0':
+            retry_after = int(response.headers.get('X-RateLimit-Reset', time.time())) - time.time()
+        if retry_after is not None:
+            self.search_bucket.penalize(max(0.0, float(retry_after)))
     
     def _empty_user_data(self) -> Dict:
         """Return empty user data structure."""
@@ -4,15 +4,58 @@ GitHub user correlation module for matching Rootly users with GitHub accounts.
 
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlencode
 import requests
-from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _candidate_patterns(name: str, email_prefix: str) -> Tuple[str, ...]:
+    """Build common GitHub username patterns from a lowercased full name and email prefix."""
+    name_parts = name.split()
+    if len(name_parts) < 2:
+        return ()
+    
+    first = name_parts[0]
+    last = name_parts[-1]
+    return (
+        f"{first}{last}",          # johnsmith
+        f"{first}.{last}",         # john.smith
+        f"{first}-{last}",         # john-smith
+        f"{first[0]}{last}",       # jsmith
+        f"{first}{last[0]}",       # johns
+        email_prefix               # from email
+    )
+
+
 class GitHubCorrelator:
     """Correlates Rootly users with GitHub accounts using multiple strategies."""
     
@@ -22,17 +65,44 @@ class GitHubCorrelator:
         self.config = config
         self.github_config = config.get('github_integration', {})
         self.organizations = self.github_config.get('organizations', ['Rootly-AI-Labs', 'rootlyhq'])
-        self.manual_mappings = self.github_config.get('user_mappings', {})
+        # Rootly emails are compared lowercased, so normalize mapping keys once
+        self.manual_mappings = {email.lower(): github_user for email, github_user
+                                in self.github_config.get('user_mappings', {}).items()}
         # Check for refresh flag in config (will be set by main.py)
         self.refresh_cache = config.get('_refresh_github_cache', False)
         self.cache_dir = Path('.github_cache')
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # Users' emails are looked up concurrently over the pooled session
+        try:
+            max_workers = int(self.github_config.get('max_workers', 4))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid github_integration.max_workers {self.github_config['max_workers']!r}, using 4")
+            max_workers = 4
+        self.max_workers = max(1, max_workers)
+        
+        # One pooled session so connections to api.github.com are reused
+        self.session = requests.Session()
+        self.session.headers.update({**self.headers, 'Accept': 'application/vnd.github+json'})
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_workers,
+            # Rate-limit responses (and their Retry-After) are left to the caller
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                              respect_retry_after_header=False)
+        ))
+        
         # Cache for API calls during this session
         self._org_members_cache = {}
         self._user_emails_cache = {}
         self._user_names_cache = {}
         
+        # ETags and the fields read from earlier responses, revalidated with If-None-Match
+        self.etag_file = self.cache_dir / 'correlator_etags.json'
+        self._etags = self._load_etags()
+        self._used_etag_keys = set()
+        self._etags_changed = False
+        
     def correlate_users(self, rootly_users: List[Dict]) -> Dict[str, Optional[str]]:
         """
         Correlate Rootly users with GitHub accounts.
@@ -49,6 +119,9 @@ class GitHubCorrelator:
         # Build email to GitHub username mapping
         email_to_github = self._build_email_mapping(github_users)
         
+        # Case-insensitive login lookup for name matching, built once per run
+        github_users_lower = {u.lower(): u for u in github_users}
+        
         # Correlate each Rootly user
         correlations = {}
         unmatched = []
@@ -71,7 +144,7 @@ class GitHubCorrelator:
                 continue
                 
             # Try name-based matching as fallback
-            github_username = self._try_name_matching(user, github_users)
+            github_username = self._try_name_matching(user, github_users, github_users_lower)
             if github_username:
                 correlations[rootly_email] = github_username
                 logger.debug(f"Matched {rootly_email} via name matching")
@@ -79,6 +152,8 @@ class GitHubCorrelator:
                 correlations[rootly_email] = None
                 unmatched.append(user)
         
+        self._save_etags()
+        
         # Report results
         matched_count = sum(1 for v in correlations.values() if v is not None)
         logger.info(f"Correlation complete: {matched_count}/{len(rootly_users)} users matched")
@@ -99,37 +174,36 @@ class GitHubCorrelator:
         all_users = set()
         
         for org in self.organizations:
-            members = self._get_org_members(org)
-            all_users.update(members)
+            all_users |= self._get_org_members(org)
             
         return all_users
     
-    @lru_cache(maxsize=10)
-    def _get_org_members(self, org: str) -> List[str]:
+    def _get_org_members(self, org: str) -> Set[str]:
         """Get all members of a GitHub organization."""
         if org in self._org_members_cache:
             return self._org_members_cache[org]
             
-        members = []
+        members = set()
         page = 1
+        per_page = 100
         
         while True:
             try:
-                response = requests.get(
+                status, data = self._cached_get(
                     f'https://api.github.com/orgs/{org}/members',
-                    headers=self.headers,
-                    params={'per_page': 100, 'page': page}
+                    params={'per_page': per_page, 'page': page},
+                    extract=lambda users: [user['login'] for user in users]
                 )
                 
-                if response.status_code != 200:
-                    logger.error(f"Failed to get members for {org}: {response.status_code}")
+                if status != 200:
+                    logger.error(f"Failed to get members for {org}: {status}")
                     break
                     
-                data = response.json()
-                if not data:
+                members.update(data)
+                
+                # A short page is the last one; don't fetch an empty page to find out
+                if len(data) < per_page:
                     break
-                    
-                members.extend(user['login'] for user in data)
                 page += 1
                 
             except Exception as e:
@@ -149,10 +223,9 @@ class GitHubCorrelator:
         cache_file = self.cache_dir / "email_mapping.json"
         if cache_file.exists() and not self.refresh_cache:
             try:
-                with open(cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                    logger.info(f"Loaded email mapping from cache: {len(cached_data)} mappings")
-                    return cached_data
+                cached_data = _loads(cache_file.read_bytes())
+                logger.info(f"Loaded email mapping from cache: {len(cached_data)} mappings")
+                return cached_data
             except Exception as e:
                 logger.warning(f"Failed to load email cache: {e}, rebuilding...")
         
@@ -162,8 +235,11 @@ class GitHubCorrelator:
         # Build fresh mapping
         logger.info("Building email mapping from GitHub commits...")
         
-        for username in github_users:
-            emails = self._get_user_emails(username)
+        usernames = list(github_users)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            user_emails = list(pool.map(self._get_user_emails, usernames))
+        
+        for username, emails in zip(usernames, user_emails):
             for email in emails:
                 email_lower = email.lower()
                 if email_lower not in email_to_user:
@@ -171,8 +247,7 @@ class GitHubCorrelator:
         
         # Save to cache (always save, no expiration)
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(email_to_user, f, indent=2)
+            cache_file.write_bytes(_dumps(email_to_user, indent=True))
             logger.info(f"Saved email mapping to cache: {len(email_to_user)} mappings")
         except Exception as e:
             logger.warning(f"Failed to save email cache: {e}")
@@ -188,12 +263,11 @@ class GitHubCorrelator:
         
         # First try to get public email from user profile
         try:
-            response = requests.get(
+            status, user_data = self._cached_get(
                 f'https://api.github.com/users/{username}',
-                headers=self.headers
+                extract=lambda user: {'email': user.get('email'), 'name': user.get('name', '')}
             )
-            if response.status_code == 200:
-                user_data = response.json()
+            if status == 200:
                 if user_data.get('email'):
                     emails.add(user_data['email'])
                 # Also get the name for better matching
@@ -201,53 +275,122 @@ class GitHubCorrelator:
         except:
             pass
         
-        # Get emails from recent commits across all org repos
-        for org in self.organizations:
-            # Get user's recent events to find repos they've contributed to
-            try:
-                response = requests.get(
-                    f'https://api.github.com/users/{username}/events',
-                    headers=self.headers,
-                    params={'per_page': 100}
-                )
-                
-                if response.status_code != 200:
-                    continue
+        # Get user's recent events once to find org repos they've contributed to
+        try:
+            status, event_repos = self._cached_get(
+                f'https://api.github.com/users/{username}/events',
+                params={'per_page': 100},
+                extract=lambda events: [event.get('repo', {}).get('name', '') for event in events
+                                        if event['type'] in ['PushEvent', 'PullRequestEvent']]
+            )
+            
+            if status == 200:
+                # Get emails from recent commits across all org repos
+                for org in self.organizations:
+                    repos_to_check = set()
                     
-                events = response.json()
-                repos_to_check = set()
-                
-                for event in events:
-                    if event['type'] in ['PushEvent', 'PullRequestEvent']:
-                        repo = event.get('repo', {}).get('name', '')
+                    for repo in event_repos:
                         if repo and (f'{org}/' in repo):
                             repos_to_check.add(repo)
-                
-                # Check commits in those repos
-                for repo in list(repos_to_check)[:5]:  # Limit to 5 repos per user
-                    try:
-                        response = requests.get(
-                            f'https://api.github.com/repos/{repo}/commits',
-                            headers=self.headers,
-                            params={'author': username, 'per_page': 10}
-                        )
-                        
-                        if response.status_code == 200:
-                            commits = response.json()
-                            for commit in commits:
-                                author = commit.get('commit', {}).get('author', {})
-                                if author.get('email'):
-                                    emails.add(author['email'])
-                    except:
-                        continue
-                        
-            except Exception as e:
-                logger.debug(f"Error getting emails for {username}: {e}")
+                    
+                    # Check commits in those repos
+                    for repo in list(repos_to_check)[:5]:  # Limit to 5 repos per org
+                        try:
+                            status, author_emails = self._cached_get(
+                                f'https://api.github.com/repos/{repo}/commits',
+                                params={'author': username, 'per_page': 10},
+                                extract=lambda commits: [commit.get('commit', {}).get('author', {}).get('email')
+                                                         for commit in commits]
+                            )
+                            
+                            if status == 200:
+                                emails.update(email for email in author_emails if email)
+                        except:
+                            continue
+                    
+        except Exception as e:
+            logger.debug(f"Error getting emails for {username}: {e}")
         
         self._user_emails_cache[username] = emails
         return emails
     
-    def _try_name_matching(self, rootly_user: Dict, github_users: Set[str]) -> Optional[str]:
+    def _cached_get(self, url: str, params: Optional[Dict] = None,
+                    extract: Optional[Callable[[Any], Any]] = None) -> Tuple[int, Any]:
+        """GET a GitHub API URL, reusing the stored result when GitHub answers 304.
+        
+        Returns the status code (200 for a revalidated response) and the parsed
+        body, reduced by ``extract`` so only the fields callers read are stored.
+        """
+        key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        self._used_etag_keys.add(key)
+        cached = self._etags.get(key)
+        if cached is not None and 'fields' not in cached:
+            # Stored by an earlier version with the full response body
+            cached = None
+        headers = {'If-None-Match': cached['etag']} if cached else None
+        
+        response = self.session.get(url, headers=headers, params=params)
+        if self._wait_for_rate_limit(response):
+            response = self.session.get(url, headers=headers, params=params)
+        
+        if response.status_code == 304 and cached:
+            return 200, cached['fields']
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        data = _loads(response.content)
+        if extract is not None:
+            data = extract(data)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etags[key] = {'etag': etag, 'fields': data}
+            self._etags_changed = True
+        return 200, data
+    
+    def _wait_for_rate_limit(self, response) -> bool:
+        """Sleep out a GitHub rate limit response; returns True if the request should be retried."""
+        if response.status_code not in (403, 429):
+            return False
+        
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            wait = float(retry_after)
+        elif response.headers.get('X-RateLimit-Remaining') == '0':
+            wait = int(response.headers.get('X-RateLimit-Reset', time.time())) - time.time() + 1
+        else:
+            return False
+        
+        wait = max(0.0, wait)
+        logger.warning(f"GitHub rate limit reached, waiting {wait:.0f}s before retrying")
+        time.sleep(wait)
+        return True
+    
+    def _load_etags(self) -> Dict:
+        """Load stored ETags and response data."""
+        if not self.etag_file.exists():
+            return {}
+        try:
+            return _loads(self.etag_file.read_bytes())
+        except Exception as e:
+            logger.warning(f"Failed to load GitHub ETag cache: {e}")
+            return {}
+    
+    def _save_etags(self):
+        """Persist ETags so later runs can make conditional requests.
+        
+        Only requests made during this run are kept, and the file is left alone
+        when nothing was added or dropped.
+        """
+        etags = {key: self._etags[key] for key in self._used_etag_keys if key in self._etags}
+        if not self._etags_changed and etags.keys() == self._etags.keys():
+            return
+        
+        try:
+            self.etag_file.write_bytes(_dumps(etags))
+        except Exception as e:
+            logger.warning(f"Failed to save GitHub ETag cache: {e}")
+    
+    def _try_name_matching(self, rootly_user: Dict, github_users: Set[str], github_users_lower: Dict[str, str]) -> Optional[str]:
         """Try to match a Rootly user to GitHub by name patterns."""
         name = rootly_user.get('name', '').lower()
         email_prefix = rootly_user.get('email', '').split('@')[0].lower()
@@ -255,33 +398,24 @@ class GitHubCorrelator:
         if not name:
             return None
         
-        # Common username patterns
-        name_parts = name.split()
-        if len(name_parts) >= 2:
-            first = name_parts[0]
-            last = name_parts[-1]
-            
-            patterns = [
-                f"{first}{last}",          # johnsmith
-                f"{first}.{last}",         # john.smith
-                f"{first}-{last}",         # john-smith
-                f"{first[0]}{last}",       # jsmith
-                f"{first}{last[0]}",       # johns
-                email_prefix               # from email
-            ]
-            
-            for pattern in patterns:
-                if pattern in github_users:
-                    return pattern
-                    
-            # Try case-insensitive match
-            github_users_lower = {u.lower(): u for u in github_users}
-            for pattern in patterns:
-                if pattern in github_users_lower:
-                    return github_users_lower[pattern]
+        patterns = _candidate_patterns(name, email_prefix)
+        
+        # Exact matches take precedence over case-insensitive ones
+        for pattern in patterns:
+            if pattern in github_users:
+                return pattern
+                
+        # Try case-insensitive match
+        for pattern in patterns:
+            if pattern in github_users_lower:
+                return github_users_lower[pattern]
         
         return None
     
+    def close(self):
+        """Release pooled HTTP connections."""
+        self.session.close()
+    
     def get_correlation_report(self, correlations: Dict[str, Optional[str]]) -> Dict:
         """Generate a report of correlation results."""
         total = len(correlations)
@@ -4,6 +4,7 @@ Interactive burnout analysis using smolagents and LLMs.
 
 import os
 import logging
+from collections import Counter
 from typing import Any, Dict
 from rich.console import Console
 from rich.panel import Panel
@@ -178,9 +179,10 @@ Type 'help' for more examples, 'quit' or 'exit' to end.
         if not individual:
             return
         
-        high_count = sum(1 for a in individual if a.get("risk_level") == "high")
-        medium_count = sum(1 for a in individual if a.get("risk_level") == "medium") 
-        low_count = sum(1 for a in individual if a.get("risk_level") == "low")
+        risk_counts = Counter(a.get("risk_level") for a in individual)
+        high_count = risk_counts["high"]
+        medium_count = risk_counts["medium"]
+        low_count = risk_counts["low"]
         
         metadata = self.results.get("metadata", {})
         